@@ -0,0 +1,109 @@
+# cython: language_level=3
+"""
+    _scratchdir_fast
+    ~~~~~~~~~~~~~~~~
+
+    Optional compiled versions of the path helpers used on every call into :class:`~scratchdir.ScratchDir`.
+
+    These mirror the pure Python implementations in :mod:`scratchdir` and are only used on Linux.
+"""
+import os
+
+from libc.errno cimport errno, EINTR
+
+
+cdef extern from "<sys/random.h>" nogil:
+    ssize_t getrandom(void *buf, size_t buflen, unsigned int flags)
+
+
+# Lowercase RFC 4648 base32 alphabet, matching `base64.b32encode(...).lower()`.
+cdef const char *B32_ALPHABET = b'abcdefghijklmnopqrstuvwxyz234567'
+
+# Number of random bytes per token. A multiple of five so the base32 encoding never needs padding.
+DEF TOKEN_BYTES = 15
+
+# Number of characters in an encoded token.
+DEF TOKEN_CHARS = 24
+
+
+cdef int _fill_random(unsigned char *buf, size_t size):
+    """
+    Fill the buffer with bytes from the kernel random number generator.
+
+    Returns -1 when `getrandom` is unavailable or fails so the caller can fall back to :func:`~os.urandom`.
+    """
+    cdef ssize_t n
+    cdef size_t filled = 0
+    while filled < size:
+        n = getrandom(buf + filled, size - filled, 0)
+        if n < 0:
+            if errno == EINTR:
+                continue
+            return -1
+        filled += n
+    return 0
+
+
+cdef str _random_token():
+    """
+    Generate a random, filesystem safe token identical in format to :func:`~scratchdir._random_token`.
+    """
+    cdef unsigned char raw[TOKEN_BYTES]
+    cdef char out[TOKEN_CHARS]
+    cdef bytes fallback
+    cdef unsigned long long group
+    cdef int i, j
+
+    if _fill_random(raw, TOKEN_BYTES) < 0:
+        fallback = os.urandom(TOKEN_BYTES)
+        for i in range(TOKEN_BYTES):
+            raw[i] = fallback[i]
+
+    for i in range(TOKEN_BYTES // 5):
+        group = 0
+        for j in range(5):
+            group = (group << 8) | raw[i * 5 + j]
+        for j in range(8):
+            out[i * 8 + j] = B32_ALPHABET[(group >> (35 - j * 5)) & 0x1f]
+
+    return out[:TOKEN_CHARS].decode('ascii')
+
+
+cdef str _fspath(object path):
+    """
+    Convert the given path-like object to an exact :class:`~str` as :func:`~posixpath.join` would.
+    """
+    if type(path) is str:
+        return path
+    path = os.fspath(path)
+    if not isinstance(path, str):
+        raise TypeError('expected str or os.PathLike object returning str, not {}'.format(type(path).__name__))
+    return str(path)
+
+
+cpdef str join_fast(object wd, tuple paths):
+    """
+    Join the given paths to the working directory, skipping `None` values and converting non-string values.
+
+    Follows the semantics of :func:`~posixpath.join`.
+    """
+    cdef str path = _fspath(wd)
+    cdef str part
+    for p in paths:
+        if p is None:
+            continue
+        part = p if type(p) is str else str(p)
+        if part.startswith('/'):
+            path = part
+        elif not path or path.endswith('/'):
+            path = path + part
+        else:
+            path = path + '/' + part
+    return path
+
+
+cpdef str filename_fast(object wd, object prefix, object suffix):
+    """
+    Build a unique filename within the working directory using the given prefix and suffix.
+    """
+    return join_fast(wd, (''.join((prefix, _random_token(), suffix)),))
@@ -4,13 +4,14 @@
 
     Context manager used to maintain your temporary directories/files.
 """
+import base64
+import contextlib
 import functools
 import os
-import shutil
 import sys
 import tempfile
 import typing
-import uuid
+from os.path import join as _ospath_join
 
 
 __all__ = ['ScratchDirError', 'ScratchDirInactiveError', 'ScratchDir']
@@ -27,6 +28,26 @@ else:
 # Default working directory value.
 DEFAULT_WD = ''
 
+# Flags used to exclusively create new files, mirroring those used by :func:`~tempfile.mkstemp`.
+BULK_CREATE_FLAGS = (os.O_RDWR | os.O_CREAT | os.O_EXCL | getattr(os, 'O_NOFOLLOW', 0) |
+                     getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0))
+
+# Message of the error raised when using a scratch dir that is not active.
+INACTIVE_ERROR_MESSAGE = 'ScratchDir must be active to perform this action'
+
+# Filesystem types whose contents are kept entirely in memory.
+MEMORY_FS_TYPES = frozenset(('tmpfs', 'ramfs'))
+
+# Local bindings for generating unique names without attribute lookups on every call.
+_urandom = os.urandom
+_b32encode = base64.b32encode
+
+# Memory backed directories are only probed for on Linux, other platforms use the default temporary directory.
+IS_LINUX = sys.platform.startswith('linux')
+
+# Mount table of the current process, used to find memory backed directories.
+MOUNTINFO_PATH = '/proc/self/mountinfo'
+
 
 class ScratchDirError(Exception):
     """
@@ -48,25 +69,193 @@ def requires_activation(func):
     """
     @functools.wraps(func)
     def decorator(self, *args, **kwargs):  # pylint: disable=missing-docstring
-        if not self.is_active:
-            raise ScratchDirInactiveError('ScratchDir must be active to perform this action')
+        if not self._active:  # pylint: disable=protected-access
+            raise ScratchDirInactiveError(INACTIVE_ERROR_MESSAGE)
         return func(self, *args, **kwargs)
     return decorator
 
 
+def _random_token() -> str:
+    """
+    Generate a random, filesystem safe token suitable for use in unique file and directory names.
+
+    :return: 24 character base32 token containing 120 bits of randomness
+    :rtype: :class:`~str`
+    """
+    return _b32encode(_urandom(15)).decode('ascii').lower()
+
+
+def _py_join(wd: str, paths: typing.Tuple[typing.Any, ...]) -> str:
+    """
+    Join the given paths to the working directory, skipping `None` values and converting non-string values.
+
+    :param wd: Working directory to join paths to
+    :type wd: :class:`~str`
+    :param paths: Paths to join
+    :type paths: :class:`~tuple`
+    :return: Fully qualified path within working directory
+    :rtype: :class:`~str`
+    """
+    return _ospath_join(wd, *[p if type(p) is str else str(p)  # pylint: disable=unidiomatic-typecheck
+                               for p in paths if p is not None])
+
+
+def _py_filename(wd: str, prefix: str, suffix: str) -> str:
+    """
+    Build a unique filename within the working directory using the given prefix and suffix.
+
+    :param wd: Working directory of the file
+    :type wd: :class:`~str`
+    :param prefix: Filename prefix
+    :type prefix: :class:`~str`
+    :param suffix: Filename suffix
+    :type suffix: :class:`~str`
+    :return: Fully qualified path of unique filename within working directory
+    :rtype: :class:`~str`
+    """
+    return _ospath_join(wd, ''.join((prefix, _random_token(), suffix)))
+
+
+# Use the compiled path helpers when the optional extension module has been built.
+_join = _py_join
+_filename = _py_filename
+if IS_LINUX:
+    try:
+        from _scratchdir_fast import filename_fast as _filename, join_fast as _join  # type: ignore
+    except ImportError:
+        pass
+
+
+def _fast_rmtree(path: str) -> None:
+    """
+    Recursively delete a directory tree.
+
+    The tree is walked iteratively with :func:`~os.scandir`, using the cached entry type to decide
+    whether to descend into or unlink each entry without an additional `stat` call. Symlinks are unlinked
+    and never followed. Entries that disappear while walking are ignored.
+
+    :param path: Path of directory to delete
+    :type path: :class:`~str`
+    :return: Nothing
+    :rtype: :class:`~NoneType`
+    """
+    stack = [path]
+    dirs = []
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        try:
+            entries = os.scandir(current)
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                try:
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
+
+    # Directories are discovered parent first so removing them in reverse empties children before parents.
+    for current in reversed(dirs):
+        try:
+            os.rmdir(current)
+        except FileNotFoundError:
+            pass
+
+
+def _memory_tempdir() -> str:
+    """
+    Get a writable directory that is backed by an in-memory filesystem, e.g. tmpfs/ramfs.
+
+    The result of the probe is cached for the lifetime of the process.
+
+    :return: Path to a memory backed directory or the default temporary directory if one cannot be found
+    :rtype: :class:`~str`
+    """
+    if IS_LINUX:
+        path = _probe_memory_tempdir()
+        if path is not None:
+            return path
+    return tempfile.gettempdir()
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_memory_tempdir() -> typing.Optional[str]:
+    """
+    Probe the mount table of the current process for a well-known directory that is mounted as an
+    in-memory filesystem.
+
+    :return: Path to a memory backed directory or `None` if one cannot be found
+    :rtype: :class:`~str` or :class:`~NoneType`
+    """
+    try:
+        with open(MOUNTINFO_PATH, encoding='utf-8', errors='surrogateescape') as mountinfo:
+            mounts = {}
+            for line in mountinfo:
+                fields, _, fstype = line.partition(' - ')
+                mounts[fields.split()[4]] = fstype.split()[0]
+    except (OSError, IndexError):
+        return None
+
+    candidates = ('/run/user/{}'.format(os.getuid()), '/dev/shm', '/run/shm', '/tmp')
+    for path in candidates:
+        if mounts.get(path) in MEMORY_FS_TYPES and os.access(path, os.W_OK | os.X_OK):
+            return path
+
+    return None
+
+
+def _slot_names(cls: type) -> typing.Tuple[str, ...]:
+    """
+    Get the names of all slots declared by the given class and its base classes.
+
+    :param cls: Class to get slot names of
+    :type cls: :class:`~type`
+    :return: Slot names, base classes first
+    :rtype: :class:`~tuple` of :class:`~str`
+    """
+    names = []  # type: typing.List[str]
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    return tuple(name for name in names if name not in ('__dict__', '__weakref__'))
+
+
 class ScratchDir:
     """
     Represents a directory on disk within the default temporary directory that can be used to store context
     specific subdirectories and files.
+
+    When `in_memory` is set and no `root` is given, the scratch dir is created within a memory backed
+    filesystem (tmpfs/ramfs) if one is available.
     """
 
+    __slots__ = ('prefix', 'suffix', 'base', 'root', 'wd', 'in_memory', '_active', '__weakref__')
+
     def __init__(self, prefix: str = '', suffix: str = '.scratchdir', base: typing.Optional[str] = None,
-                 root: typing.Optional[str] = tempfile.tempdir, wd: str = DEFAULT_WD) -> None:
+                 root: typing.Optional[str] = tempfile.tempdir, wd: str = DEFAULT_WD,
+                 in_memory: bool = False) -> None:
         self.prefix = prefix
         self.suffix = suffix
         self.base = base
         self.root = root
         self.wd = wd
+        self.in_memory = in_memory
+        self._active = False
+
+    def __getstate__(self) -> typing.Tuple[typing.Tuple[typing.Any, ...], typing.Optional[dict]]:
+        # Subclasses that do not declare slots also carry an instance dict that must be preserved.
+        return tuple(getattr(self, name) for name in _slot_names(type(self))), getattr(self, '__dict__', None)
+
+    def __setstate__(self, state: typing.Tuple[typing.Tuple[typing.Any, ...], typing.Optional[dict]]) -> None:
+        values, attrs = state
+        for name, value in zip(_slot_names(type(self)), values):
+            setattr(self, name, value)
+        if attrs:
+            self.__dict__.update(attrs)
 
     def __enter__(self) -> 'ScratchDir':
         self.setup()
@@ -86,7 +275,22 @@ class ScratchDir:
         :return: Boolean indicating if the scratch dir is active or not
         :rtype: :class:`~bool`
         """
-        return bool(self.wd) and os.path.exists(self.wd)
+        return self._active and bool(self.wd) and os.path.exists(self.wd)
+
+    def verify_active(self) -> None:
+        """
+        Assert that the scratch dir is active and its working directory still exists on disk.
+
+        Methods that require an active scratch dir only check that :meth:`~scratchdir.ScratchDir.setup`
+        has been called so they do not hit the filesystem on every call. Use this to also verify the
+        working directory has not been removed out from under the scratch dir.
+
+        :return: Nothing
+        :rtype: :class:`~NoneType`
+        :raises ScratchDirInactiveError: When the scratch dir is not active
+        """
+        if not self.is_active:
+            raise ScratchDirInactiveError(INACTIVE_ERROR_MESSAGE)
 
     def setup(self) -> None:
         """
@@ -96,8 +300,13 @@ class ScratchDir:
         :return: Nothing
         :rtype: :class:`~NoneType`
         """
-        tempfile.tempdir = self.root
-        self.wd = self.wd or tempfile.mkdtemp(self.suffix, self.prefix, self.base)
+        if not self.wd:
+            parent = self.base if self.base is not None else self.root
+            if parent is None and self.in_memory:
+                parent = _memory_tempdir()
+            self.wd = tempfile.mkdtemp(self.suffix, self.prefix, parent)
+
+        self._active = True
 
     @requires_activation
     def teardown(self) -> None:
@@ -107,8 +316,9 @@ class ScratchDir:
         :return: Nothing
         :rtype: :class:`~NoneType`
         """
-        shutil.rmtree(self.wd)
+        _fast_rmtree(self.wd)
         self.wd = DEFAULT_WD
+        self._active = False
 
     @requires_activation
     def child(self, prefix: str = '', suffix: str = '.scratchdir') -> 'ScratchDir':
@@ -126,6 +336,34 @@ class ScratchDir:
         return self.__class__(prefix, suffix, self.wd)
 
     @requires_activation
+    def nested(self, *prefixes: str, suffix: str = '.scratchdir') -> typing.List['ScratchDir']:
+        """
+        Create a chain of new :class:`~scratchdir.ScratchDir` instances, each nested within the working
+        directory of the one before it, starting within this scratch dir.
+
+        All directories in the chain are created up front rather than one at a time through
+        :meth:`~scratchdir.ScratchDir.setup`, each readable/writable only by the current user in the same manner
+        as :func:`~tempfile.mkdtemp`. The returned instances still need to be activated before use, e.g. with
+        the `with` statement.
+
+        :param prefixes: Prefix of the temporary directory for each level of nesting, outermost first
+        :type prefixes: :class:`~tuple` of :class:`~str`
+        :param suffix: (Optional) suffix of the temporary directory for every level of nesting
+        :type suffix: :class:`~str`
+        :return: List of ScratchDir instances, outermost first
+        :rtype: :class:`~list` of :class:`~scratchdir.ScratchDir`
+        """
+        children = []
+        base = self.wd
+        for prefix in prefixes:
+            wd = _filename(base, prefix, suffix)
+            # Create each level individually as :func:`~os.makedirs` only applies the mode to the last one.
+            os.mkdir(wd, 0o700)
+            children.append(self.__class__(prefix, suffix, base, wd=wd))
+            base = wd
+
+        return children
+
     def file(self, mode: str = 'w+b', buffering: int = -1, encoding: typing.Optional[str] = None,
              newline: typing.Optional[str] = None, suffix: typing.Optional[str] = DEFAULT_SUFFIX,
              prefix: typing.Optional[str] = DEFAULT_PREFIX, dir: typing.Optional[str] = None) -> typing.IO:
@@ -152,10 +390,12 @@ class ScratchDir:
         :return: file-like object as returned by :func:`~tempfile.TemporaryFile`
         :rtype: :class:`~_io.BufferedRandom`
         """
+        if not self._active:
+            raise ScratchDirInactiveError(INACTIVE_ERROR_MESSAGE)
+
         return tempfile.TemporaryFile(mode, buffering, encoding, newline,
-                                      suffix, prefix, self.join(dir))
+                                      suffix, prefix, self._resolve_dir(dir))
 
-    @requires_activation
     def named(self, mode: str = 'w+b', buffering: int = -1, encoding: typing.Optional[str] = None,
               newline: typing.Optional[str] = None, suffix: typing.Optional[str] = DEFAULT_SUFFIX,
               prefix: typing.Optional[str] = DEFAULT_PREFIX, dir: typing.Optional[str] = None,
@@ -166,6 +406,10 @@ class ScratchDir:
         This returns the result of :func:`~tempfile.NamedTemporaryFile` which returns a named, file-like object that
         will cease to exist once it is closed unless `delete` is set to `False`.
 
+        When `delete` is `False`, the file is created with :func:`~tempfile.mkstemp` and opened directly, skipping
+        the wrapper used to delete the file on close. The `name` attribute of the returned file object is still set
+        to the path of the file.
+
         :param mode: (Optional) mode to open the file with
         :type mode: :class:`~str`
         :param buffering: (Optional) size of the file buffer
@@ -182,13 +426,34 @@ class ScratchDir:
         :type dir: :class:`~str` or :class:`~NoneType`
         :param delete: (Optional) flag to indicate if the file should be deleted from disk when it is closed
         :type delete: :class:`~bool`
-        :return: file-like object as returned by :func:`~tempfile.NamedTemporaryFile`
-        :rtype: :class:`~_io.TemporaryFileWrapper`
+        :return: file-like object as returned by :func:`~tempfile.NamedTemporaryFile` or :func:`~open`
+        :rtype: :class:`~_io.TemporaryFileWrapper` or :class:`~_io.BufferedRandom`
         """
-        return tempfile.NamedTemporaryFile(mode, buffering, encoding, newline,
-                                           suffix, prefix, self.join(dir), delete)
+        if not self._active:
+            raise ScratchDirInactiveError(INACTIVE_ERROR_MESSAGE)
+
+        if delete:
+            return tempfile.NamedTemporaryFile(mode, buffering, encoding, newline,
+                                               suffix, prefix, self._resolve_dir(dir), delete)
+
+        fd, filename = tempfile.mkstemp(suffix, prefix, self._resolve_dir(dir))
+        # Once the opener has been called, the file object owns the descriptor and closes it on failure.
+        opened = []  # type: typing.List[int]
+
+        def opener(*_: typing.Any) -> int:
+            opened.append(fd)
+            return fd
+
+        try:
+            # Open by name so the file object reports the path, but reuse the descriptor mkstemp already has open.
+            return open(filename, mode, buffering, encoding, newline=newline, opener=opener)
+        except BaseException:
+            if not opened:
+                with contextlib.suppress(OSError):
+                    os.close(fd)
+            os.unlink(filename)
+            raise
 
-    @requires_activation
     def spooled(self, max_size: int = 0, mode: str = 'w+b', buffering: int = -1,
                 encoding: typing.Optional[str] = None, newline: typing.Optional[str] = None,
                 suffix: typing.Optional[str] = DEFAULT_SUFFIX, prefix: typing.Optional[str] = DEFAULT_PREFIX,
@@ -221,22 +486,24 @@ class ScratchDir:
         :return: SpooledTemporaryFile instance
         :rtype: :class:`~tempfile.SpooledTemporaryFile`
         """
+        if not self._active:
+            raise ScratchDirInactiveError(INACTIVE_ERROR_MESSAGE)
+
         return tempfile.SpooledTemporaryFile(max_size, mode, buffering, encoding,
-                                             newline, suffix, prefix, self.join(dir))
+                                             newline, suffix, prefix, self._resolve_dir(dir))
 
-    @requires_activation
     def secure(self, suffix: typing.Optional[str] = DEFAULT_SUFFIX,
                prefix: typing.Optional[str] = DEFAULT_PREFIX, dir: typing.Optional[str] = None,
-               text: bool = False, return_fd: bool = True) -> typing.Union[str, typing.Tuple[int, str]]:
+               text: bool = False, return_fd: bool = False) -> typing.Union[str, typing.Tuple[int, str]]:
         """
         Create a new temporary file within the scratch dir in the most secure manner possible
         with the lowest possibility of race conditions during creation.
 
-        This returns the result of :func:`~tempfile.mkstemp` which returns the file descriptor and filename to
-        the newly created temporary file.
+        This calls :func:`~tempfile.mkstemp` which creates the file and opens a file descriptor to it.
 
-        By default, the caller is only passed back the file descriptor and filename unless
-        `return_fd` is set to `False`.
+        By default, the file descriptor is closed and the caller is only passed back the filename unless
+        `return_fd` is set to `True`. When it is, the caller is responsible for closing the file descriptor;
+        prefer :meth:`~scratchdir.ScratchDir.secure_open` which does so automatically.
 
         :param suffix: (Optional) filename suffix
         :type suffix: :class:`~str` or :class:`~NoneType`
@@ -251,14 +518,100 @@ class ScratchDir:
         :return: String representing the temporary file name or Tuple of file descriptor and filename
         :rtype: :class:`~str` or :class:`~tuple`
         """
-        fd, filename = tempfile.mkstemp(suffix, prefix, self.join(dir), text)
+        if not self._active:
+            raise ScratchDirInactiveError(INACTIVE_ERROR_MESSAGE)
+
+        fd, filename = tempfile.mkstemp(suffix, prefix, self._resolve_dir(dir), text)
         if return_fd:
             return fd, filename
 
         os.close(fd)
         return filename
 
+    def mkstemp(self, suffix: typing.Optional[str] = DEFAULT_SUFFIX,
+                prefix: typing.Optional[str] = DEFAULT_PREFIX, dir: typing.Optional[str] = None,
+                text: bool = False) -> typing.Tuple[int, str]:
+        """
+        Create a new temporary file within the scratch dir in the same manner as :meth:`~scratchdir.ScratchDir.secure`.
+
+        This mirrors :func:`~tempfile.mkstemp` and always returns the open file descriptor along with the filename.
+        The caller is responsible for closing the file descriptor.
+
+        :param suffix: (Optional) filename suffix
+        :type suffix: :class:`~str` or :class:`~NoneType`
+        :param prefix: (Optional) filename prefix
+        :type prefix: :class:`~str` or :class:`~NoneType`
+        :param dir: (Optional) relative path to directory within the scratch dir where the file should exist
+        :type dir: :class:`~str` or :class:`~NoneType`
+        :param text: (Optional) flag to indicate if the file should be opened in text mode instead of binary
+        :type text: :class:`~bool`
+        :return: Tuple of file descriptor and filename
+        :rtype: :class:`~tuple`
+        """
+        return typing.cast(typing.Tuple[int, str], self.secure(suffix, prefix, dir, text, return_fd=True))
+
     @requires_activation
+    @contextlib.contextmanager
+    def secure_open(self, suffix: typing.Optional[str] = DEFAULT_SUFFIX,
+                    prefix: typing.Optional[str] = DEFAULT_PREFIX, dir: typing.Optional[str] = None,
+                    text: bool = False) -> typing.Iterator[typing.Tuple[int, str]]:
+        """
+        Create a new temporary file within the scratch dir in the same manner as
+        :meth:`~scratchdir.ScratchDir.secure` for use with the `with` statement.
+
+        The file descriptor is guaranteed to be closed when the context exits. The file itself remains
+        on disk until the scratch dir is torn down.
+
+        :param suffix: (Optional) filename suffix
+        :type suffix: :class:`~str` or :class:`~NoneType`
+        :param prefix: (Optional) filename prefix
+        :type prefix: :class:`~str` or :class:`~NoneType`
+        :param dir: (Optional) relative path to directory within the scratch dir where the file should exist
+        :type dir: :class:`~str` or :class:`~NoneType`
+        :param text: (Optional) flag to indicate if the file should be opened in text mode instead of binary
+        :type text: :class:`~bool`
+        :return: Context manager that yields a Tuple of file descriptor and filename
+        :rtype: :class:`~contextlib._GeneratorContextManager`
+        """
+        fd, filename = tempfile.mkstemp(suffix, prefix, self._resolve_dir(dir), text)
+        try:
+            yield fd, filename
+        finally:
+            os.close(fd)
+
+    @requires_activation
+    def bulk_create(self, count: int, suffix: typing.Optional[str] = DEFAULT_SUFFIX,
+                    prefix: typing.Optional[str] = DEFAULT_PREFIX,
+                    dir: typing.Optional[str] = None) -> typing.List[str]:
+        """
+        Create a number of new, empty temporary files within the scratch dir in a single call.
+
+        Each file is created exclusively and readable/writable only by the current user, in the same
+        manner as :meth:`~scratchdir.ScratchDir.secure`. The file descriptors are closed before returning.
+
+        :param count: Number of files to create
+        :type count: :class:`~int`
+        :param suffix: (Optional) filename suffix
+        :type suffix: :class:`~str` or :class:`~NoneType`
+        :param prefix: (Optional) filename prefix
+        :type prefix: :class:`~str` or :class:`~NoneType`
+        :param dir: (Optional) relative path to directory within the scratch dir where the files should exist
+        :type dir: :class:`~str` or :class:`~NoneType`
+        :return: List of filenames of the newly created temporary files
+        :rtype: :class:`~list` of :class:`~str`
+        """
+        prefix = prefix if prefix is not None else ''
+        suffix = suffix if suffix is not None else ''
+        path = self._resolve_dir(dir)
+
+        filenames = []
+        for _ in range(count):
+            filename = _filename(path, prefix, suffix)
+            os.close(os.open(filename, BULK_CREATE_FLAGS, 0o600))
+            filenames.append(filename)
+
+        return filenames
+
     def dir(self, suffix: typing.Optional[str] = DEFAULT_SUFFIX,
             prefix: typing.Optional[str] = DEFAULT_PREFIX,
             dir: typing.Optional[str] = None) -> tempfile.TemporaryDirectory:
@@ -275,9 +628,11 @@ class ScratchDir:
         :return: Temporary directory
         :rtype: :class:`~tempfile.TemporaryDirectory`
         """
-        return tempfile.TemporaryDirectory(suffix, prefix, self.join(dir))
+        if not self._active:
+            raise ScratchDirInactiveError(INACTIVE_ERROR_MESSAGE)
+
+        return tempfile.TemporaryDirectory(suffix, prefix, self._resolve_dir(dir))
 
-    @requires_activation
     def directory(self, suffix: typing.Optional[str] = DEFAULT_SUFFIX,
                   prefix: typing.Optional[str] = DEFAULT_PREFIX,
                   dir: typing.Optional[str] = None) -> str:
@@ -296,9 +651,11 @@ class ScratchDir:
         :return: Path on disk where new directory exists
         :rtype: :class:`~str`
         """
-        return tempfile.mkdtemp(suffix, prefix, self.join(dir))
+        if not self._active:
+            raise ScratchDirInactiveError(INACTIVE_ERROR_MESSAGE)
+
+        return tempfile.mkdtemp(suffix, prefix, self._resolve_dir(dir))
 
-    @requires_activation
     def filename(self, suffix: typing.Optional[str] = DEFAULT_SUFFIX,
                  prefix: typing.Optional[str] = DEFAULT_PREFIX) -> str:
         """
@@ -314,11 +671,13 @@ class ScratchDir:
         :return: Path in scratch dir for unique filename
         :rtype: :class:`~str`
         """
+        if not self._active:
+            raise ScratchDirInactiveError(INACTIVE_ERROR_MESSAGE)
+
         prefix = prefix if prefix is not None else ''
         suffix = suffix if suffix is not None else ''
-        return self.join(''.join((prefix, str(uuid.uuid4()), suffix)))
+        return _filename(self.wd, prefix, suffix)
 
-    @requires_activation
     def join(self, *paths: str) -> str:
         """
         Builds a fully qualified path to the given location relative to the scratch dir.
@@ -328,12 +687,29 @@ class ScratchDir:
         :return: Fully qualified path within scratch dir
         :rtype: :class:`~str`
         """
-        return os.path.join(self.wd, *(str(p) for p in paths if p is not None))
+        if not self._active:
+            raise ScratchDirInactiveError(INACTIVE_ERROR_MESSAGE)
+
+        if not paths or paths == (None,):
+            return self.wd
+        return _join(self.wd, paths)
+
+    def _resolve_dir(self, dir: typing.Optional[str]) -> str:
+        """
+        Resolve the `dir` argument of a method to a fully qualified path within the scratch dir.
+
+        :param dir: (Optional) relative path to directory within the scratch dir
+        :type dir: :class:`~str` or :class:`~NoneType`
+        :return: Fully qualified path within scratch dir
+        :rtype: :class:`~str`
+        """
+        if dir is None:
+            return self.wd
+        return self.join(dir)
 
     # Aliases
     TemporaryFile = file
     NamedTemporaryFile = named
     SpooledTemporaryFile = spooled
     TemporaryDirectory = dir
-    mkstemp = secure
     mkdtemp = directory
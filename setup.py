@@ -7,10 +7,17 @@
     :copyright: (c) 2017 Andrew Hawker.
     :license: Apache 2.0, see LICENSE for more details.
 """
+import sys
+
+try:
+    from setuptools import Extension, setup
+except ImportError:
+    from distutils.core import Extension, setup
+
 try:
-    from setuptools import setup
+    from Cython.Build import cythonize
 except ImportError:
-    from distutils.core import setup
+    cythonize = None
 
 
 def get_long_description():
@@ -18,6 +25,15 @@ def get_long_description():
         return f.read()
 
 
+def get_ext_modules():
+    # The compiled path helpers are optional; scratchdir falls back to pure Python when they aren't built.
+    # They rely on getrandom(2) so are only built on Linux.
+    if cythonize is None or not sys.platform.startswith('linux'):
+        return []
+    return cythonize([Extension('_scratchdir_fast', ['_scratchdir_fast.pyx'], optional=True)],
+                     language_level=3)
+
+
 setup(
     name='scratchdir',
     version='1.0.2',
@@ -29,6 +45,7 @@ setup(
     long_description=get_long_description(),
     long_description_content_type='text/markdown',
     py_modules=['scratchdir'],
+    ext_modules=get_ext_modules(),
     classifiers=(
         'Development Status :: 5 - Production/Stable',
         'Intended Audience :: Developers',
@@ -0,0 +1,6 @@
+"""
+    tests
+    ~~~~~
+
+    Tests for the :mod:`~scratchdir` module.
+"""
@@ -0,0 +1,103 @@
+"""
+    tests.conftest
+    ~~~~~~~~~~~~~~
+
+    Fixtures shared by the tests for the :mod:`~scratchdir` module.
+"""
+
+import itertools
+import os
+import shutil
+import sys
+
+import pytest
+
+import scratchdir
+
+
+# Used to give each test a unique directory within the session root.
+_counter = itertools.count()
+
+
+def pytest_configure():
+    """
+    Root the pytest temporary directories on the memory backed `/dev/shm` filesystem on Linux, so the
+    filesystem work done by the tests never waits on disk.
+
+    Only the root is moved; pytest still creates numbered, locked and pruned base directories within it
+    and an explicit `--basetemp` or `PYTEST_DEBUG_TEMPROOT` takes precedence.
+    """
+    if sys.platform.startswith('linux') and os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        os.environ.setdefault('PYTEST_DEBUG_TEMPROOT', '/dev/shm')
+
+
+@pytest.fixture(scope='session')
+def _tmp_root(tmp_path_factory):
+    """
+    Fixture that yields a directory that is created once per test session and is used as the parent
+    of all per-test directories.
+    """
+    return tmp_path_factory.mktemp('scratchdir-root')
+
+
+@pytest.fixture(scope='session')
+def _scratch_dir_cls():
+    """
+    Fixture that yields the :class:`~scratchdir.ScratchDir` class, resolved once per test session.
+    """
+    return scratchdir.ScratchDir
+
+
+def _unique_dir(root):
+    """
+    Helper function to create a new directory with a unique name within the given root.
+    """
+    path = root / 't{}'.format(next(_counter))
+    path.mkdir()
+    return str(path)
+
+
+@pytest.fixture(scope='function')
+def scratch_dir(_scratch_dir_cls, _tmp_root):
+    """
+    Fixture that yields a :class:`~scratchdir.ScratchDir` instance with a root directory
+    that is unique to each test invocation.
+    """
+    return _scratch_dir_cls(root=_unique_dir(_tmp_root))
+
+
+@pytest.fixture(scope='function')
+def inactive_scratch_dir(_scratch_dir_cls):
+    """
+    Fixture that yields a :class:`~scratchdir.ScratchDir` instance that is never set up.
+
+    No directories are created for the instance, so it is only suitable for tests of inactive behavior.
+    """
+    return _scratch_dir_cls()
+
+
+@pytest.fixture(scope='module')
+def _module_scratch_dir(_tmp_root):
+    """
+    Fixture that yields a :class:`~scratchdir.ScratchDir` instance that is active for the duration
+    of a test module.
+    """
+    with scratchdir.ScratchDir(root=_unique_dir(_tmp_root)) as sd:
+        yield sd
+
+
+@pytest.fixture(scope='function')
+def active_scratch_dir(_module_scratch_dir):
+    """
+    Fixture that yields a :class:`~scratchdir.ScratchDir` instance that has already performed
+    the setup process and is active.
+
+    The instance is shared by all tests within a module; anything created within it by a test is
+    removed once that test completes.
+    """
+    yield _module_scratch_dir
+    for entry in os.scandir(_module_scratch_dir.wd):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
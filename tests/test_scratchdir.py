@@ -0,0 +1,720 @@
+"""
+    tests.test_scratchdir
+    ~~~~~~~~~~~~~~~~~~~~~
+
+    Tests for the :mod:`~scratchdir` module.
+"""
+
+import copy
+import io
+import os
+import pathlib
+import pickle
+import tempfile
+import weakref
+from unittest import mock
+
+import pytest
+
+import scratchdir
+from scratchdir import ScratchDir, ScratchDirInactiveError
+
+
+# Methods that raise when called on a :class:`~scratchdir.ScratchDir` that is not active.
+INACTIVE_GUARDED_METHODS = (
+    ScratchDir.teardown,
+    ScratchDir.child,
+    ScratchDir.nested,
+    ScratchDir.file,
+    ScratchDir.named,
+    ScratchDir.spooled,
+    ScratchDir.secure,
+    ScratchDir.secure_open,
+    ScratchDir.bulk_create,
+    ScratchDir.dir,
+    ScratchDir.directory,
+    ScratchDir.filename,
+    ScratchDir.join,
+    ScratchDir.TemporaryFile,
+    ScratchDir.NamedTemporaryFile,
+    ScratchDir.SpooledTemporaryFile,
+    ScratchDir.mkstemp,
+    ScratchDir.mkdtemp
+)
+
+# Public attributes of the :class:`~io.IOBase` abstract class that file-like objects must implement.
+IOBASE_API = frozenset(name for name in dir(io.IOBase) if not name.startswith('_'))
+
+
+class StrSubclass(str):
+    """
+    Subclass of :class:`~str` used to check that path helpers do not require an exact :class:`~str`.
+    """
+
+
+class ScratchDirSubclass(ScratchDir):
+    """
+    Subclass of :class:`~scratchdir.ScratchDir` that declares its own slots.
+    """
+
+    __slots__ = ('extra',)
+
+
+class ScratchDirDictSubclass(ScratchDir):
+    """
+    Subclass of :class:`~scratchdir.ScratchDir` that does not declare slots and so has an instance dict.
+    """
+
+
+def is_file_like_obj(obj):
+    """
+    Helper function to check that the given object implements all public methods of the
+    :class:`~io.IOBase` abstract class.
+    """
+    return all(hasattr(obj, name) for name in IOBASE_API)
+
+
+def is_pardir(pardir, subdir):
+    """
+    Helper function to check if the given path is a parent of another.
+    """
+    pardir = os.path.realpath(pardir)
+    subdir = os.path.realpath(subdir)
+    return subdir != pardir and subdir.startswith(pardir + os.sep)
+
+
+def assert_raises_inactive(func, *args):
+    """
+    Helper function to check that calling the given function raises a
+    :class:`~scratchdir.ScratchDirInactiveError` exception.
+    """
+    try:
+        func(*args)
+    except ScratchDirInactiveError:
+        return
+    raise AssertionError('{} did not raise ScratchDirInactiveError'.format(func.__qualname__))
+
+
+def test_scratch_enter_calls_setup(scratch_dir, mocker):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.__enter__` calls :meth:`~scratchdir.ScratchDir.setup`.
+    """
+    spy = mocker.spy(scratchdir.ScratchDir, 'setup')
+    with scratch_dir:
+        assert spy.called
+
+
+def test_scratch_exit_calls_teardown(scratch_dir, mocker):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.__exit__` calls :meth:`~scratchdir.ScratchDir.teardown`.
+    """
+    spy = mocker.spy(scratchdir.ScratchDir, 'teardown')
+    with scratch_dir:
+        pass
+    assert spy.called
+
+
+def test_scratch_is_not_active_when_wd_not_set(inactive_scratch_dir):
+    """
+    Assert that :prop:`~scratchdir.ScratchDir.active` is `False` when the
+    working directory is not set.
+    """
+    inactive_scratch_dir.wd = None
+    assert not inactive_scratch_dir.is_active
+
+
+def test_scratch_is_not_active_when_wd_does_not_exist(active_scratch_dir, monkeypatch):
+    """
+    Assert that an active :prop:`~scratchdir.ScratchDir.active` is `False` when the
+    working directory does not exist.
+    """
+    assert active_scratch_dir.is_active
+    monkeypatch.setattr(active_scratch_dir, 'wd', active_scratch_dir.join(os.urandom(8).hex()))
+    assert not active_scratch_dir.is_active
+
+
+def test_scratch_file_methods_follow_reassigned_wd(active_scratch_dir, monkeypatch):
+    """
+    Assert that methods on :class:`~scratchdir.ScratchDir` that create files use the current working directory
+    when it is reassigned after :meth:`~scratchdir.ScratchDir.setup` is called.
+    """
+    monkeypatch.setattr(active_scratch_dir, 'wd', active_scratch_dir.directory())
+    fd, mkstemp_name = active_scratch_dir.mkstemp()
+    os.close(fd)
+    with active_scratch_dir.named() as f:
+        named_name = f.name
+    for name in (active_scratch_dir.secure(), mkstemp_name, named_name,
+                 create_named(active_scratch_dir, None, delete=False)):
+        assert os.path.dirname(name) == active_scratch_dir.wd
+
+
+def test_scratch_is_not_active_when_wd_given_but_setup_not_called(tmpdir):
+    """
+    Assert that a :prop:`~scratchdir.ScratchDir.is_active` is `False` when given an existing
+    working directory but :meth:`~scratchdir.ScratchDir.setup` has not been called.
+    """
+    assert not ScratchDir(wd=tmpdir.strpath).is_active
+
+
+def test_scratch_methods_do_not_check_wd_exists(active_scratch_dir, mocker):
+    """
+    Assert that methods which require an active :class:`~scratchdir.ScratchDir` do not check
+    that the working directory exists on disk.
+    """
+    patched = mocker.patch('os.path.exists')
+    active_scratch_dir.filename()
+    assert not patched.called
+
+
+def test_scratch_verify_active_raises_when_wd_does_not_exist(active_scratch_dir, monkeypatch):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.verify_active` raises a :class:`~scratchdir.ScratchDirInactiveError`
+    when the working directory does not exist.
+    """
+    active_scratch_dir.verify_active()
+    monkeypatch.setattr(active_scratch_dir, 'wd', active_scratch_dir.join(os.urandom(8).hex()))
+    with pytest.raises(ScratchDirInactiveError):
+        active_scratch_dir.verify_active()
+
+
+def test_scratch_is_not_active_when_setup_not_called(inactive_scratch_dir):
+    """
+    Assert that a :prop:`~scratchdir.ScratchDir.is_active` is `False` when
+    :meth:`~scratchdir.ScratchDir.setup` has not been called.
+    """
+    assert not inactive_scratch_dir.is_active
+
+
+def test_scratch_is_active_when_inside_context_manager(scratch_dir):
+    """
+    Assert that a :prop:`~scratchdir.ScratchDir.is_active` is `True` when
+    the :meth:`~scratchdir.ScratchDir.__enter__` is called.
+    """
+    assert not scratch_dir.is_active
+    with scratch_dir:
+        assert scratch_dir.is_active
+
+
+def test_scratch_is_not_active_after_context_manager(scratch_dir):
+    """
+    Assert that a :prop:`~scratchdir.ScratchDir.is_active` is `False` after
+    the :meth:`~scratchdir.ScratchDir.__exit__` is called.
+    """
+    with scratch_dir:
+        pass
+    assert not scratch_dir.is_active
+
+
+def test_scratch_setup_assigns_wd(scratch_dir):
+    """
+    Assert that :attr:`~scratchdir.ScratchDir.wd` is set after :meth:`~scratchdir.ScratchDir.setup` is called.
+    """
+    with scratch_dir:
+        assert scratch_dir.wd != scratchdir.DEFAULT_WD
+
+
+@mock.patch('scratchdir._fast_rmtree')
+@mock.patch('tempfile.mkdtemp', return_value='/scratchdir/wd')
+def test_scratch_teardown_removes_files_and_unassigns_wd(mkdtemp, rmtree):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.teardown` removes the working directory and that
+    :attr:`~scratchdir.ScratchDir.wd` is not set afterwards.
+    """
+    sd = ScratchDir()
+    with sd:
+        assert sd.wd == mkdtemp.return_value
+    rmtree.assert_called_once_with(mkdtemp.return_value)
+    assert sd.wd == scratchdir.DEFAULT_WD
+    assert not sd.is_active
+
+
+def test_scratch_methods_raise_when_not_active(inactive_scratch_dir):
+    """
+    Assert that expected methods on the :class:`~scratchdir.ScratchDir` class raise a
+    :class:`~scratchdir.ScratchDirInactiveError` exception when called while the instance is not active.
+    """
+    for method in INACTIVE_GUARDED_METHODS:
+        assert_raises_inactive(method, inactive_scratch_dir)
+
+
+@pytest.mark.parametrize('method_name', [
+    'file',
+    'named',
+    'secure',
+    'TemporaryFile',
+    'NamedTemporaryFile',
+    'mkstemp'
+])
+def test_scratch_methods_given_unknown_subdir_raise(active_scratch_dir, method_name):
+    """
+    Assert that methods on :class:`~scratchdir.ScratchDir` that support a `dir` parameter will raise
+    a :class:`~FileNotFoundError` when the dir does not exist.
+    """
+    method = getattr(active_scratch_dir, method_name)
+    with pytest.raises(FileNotFoundError):
+        assert method(dir='foo')
+
+
+def test_scratch_child_returns_scratch_dir_instance(active_scratch_dir):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.child` returns a :class:`~scratchdir.ScratchDir` instance.
+    """
+    assert isinstance(active_scratch_dir.child(), scratchdir.ScratchDir)
+
+
+def test_scratch_child_wd_is_within_parent_wd(active_scratch_dir):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.child` returns a :class:`~scratchdir.ScratchDir` instance
+    whose working directory is a subdirectory of the working directory of the parent instance.
+    """
+    with active_scratch_dir.child() as child:
+        assert is_pardir(active_scratch_dir.wd, child.wd)
+
+
+@pytest.fixture(scope='class')
+def file_scratch_dir(tmp_path_factory):
+    """
+    Fixture that yields a :class:`~scratchdir.ScratchDir` instance that is active for the duration
+    of a test class.
+    """
+    with ScratchDir(root=str(tmp_path_factory.mktemp('file-like'))) as sd:
+        yield sd
+
+
+class TestFileLikeInterface:
+    """
+    Tests for methods of :class:`~scratchdir.ScratchDir` that return file-like objects.
+
+    All tests within the class share a single active scratch dir.
+    """
+
+    @pytest.mark.parametrize('method_name', [
+        'file',
+        'named',
+        'TemporaryFile',
+        'NamedTemporaryFile'
+    ])
+    def test_scratch_file_supports_file_obj_interface(self, file_scratch_dir, method_name):
+        """
+        Assert that methods of :class:`~scratchdir.ScratchDir` that are expected to return file-like objects
+        do so and these objects implement, atleast, the :class:`~io.IOBase` interface.
+        """
+        method = getattr(file_scratch_dir, method_name)
+        with method() as f:
+            assert is_file_like_obj(f)
+
+
+def test_scratch_secure_returns_only_name_by_default(active_scratch_dir):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.secure` returns a :class:`str` containing the filename
+    of the newly created temporary file by default.
+    """
+    result = active_scratch_dir.secure()
+    assert isinstance(result, str)
+    assert os.path.exists(result)
+
+
+def test_scratch_secure_returns_fd_and_name_on_toggle(active_scratch_dir):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.secure` returns a two item tuple containing the file descriptor
+    and filename of the newly created temporary file when configured to do so.
+    """
+    result = active_scratch_dir.secure(return_fd=True)
+    assert isinstance(result, tuple)
+    assert isinstance(result[0], int)
+    assert isinstance(result[1], str)
+    assert os.path.exists(result[1])
+    os.close(result[0])
+
+
+def test_scratch_mkstemp_returns_fd_and_name(active_scratch_dir):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.mkstemp` returns a two item tuple containing the file descriptor
+    and filename of the newly created temporary file, matching :func:`~tempfile.mkstemp`.
+    """
+    fd, filename = active_scratch_dir.mkstemp()
+    assert isinstance(fd, int)
+    assert isinstance(filename, str)
+    assert os.path.exists(filename)
+    os.close(fd)
+
+
+def test_scratch_secure_open_closes_fd_on_exit(active_scratch_dir):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.secure_open` yields an open file descriptor and filename
+    and closes the file descriptor when the context exits.
+    """
+    with active_scratch_dir.secure_open() as (fd, filename):
+        assert os.write(fd, b'scratch') == 7
+        assert os.path.exists(filename)
+    with pytest.raises(OSError):
+        os.fstat(fd)
+    assert os.path.exists(filename)
+
+
+def test_scratch_in_memory_uses_memory_tempdir(tmpdir, monkeypatch):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.setup` creates the working directory within the memory backed
+    directory when `in_memory` is set and no root is given.
+    """
+    monkeypatch.setattr(scratchdir, '_memory_tempdir', lambda: tmpdir.strpath)
+    with ScratchDir(root=None, in_memory=True) as sd:
+        assert is_pardir(tmpdir.strpath, sd.wd)
+
+
+def test_scratch_in_memory_prefers_explicit_root(tmpdir, mocker):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.setup` does not probe for a memory backed directory
+    when a root is given.
+    """
+    patched = mocker.patch('scratchdir._memory_tempdir')
+    with ScratchDir(root=tmpdir.strpath, in_memory=True) as sd:
+        assert is_pardir(tmpdir.strpath, sd.wd)
+    assert not patched.called
+
+
+def test_probe_memory_tempdir_returns_none_without_proc(monkeypatch):
+    """
+    Assert that :func:`~scratchdir._probe_memory_tempdir` returns `None` when the mount table cannot be read.
+    """
+    def raise_not_found(*args, **kwargs):
+        raise FileNotFoundError
+
+    monkeypatch.setattr('builtins.open', raise_not_found)
+    assert scratchdir._probe_memory_tempdir.__wrapped__() is None
+
+
+def mountinfo_line(mount_point, fstype):
+    """
+    Helper function to build a line of `/proc/self/mountinfo` for the given mount point and filesystem type.
+    """
+    return '36 25 0:32 / {} rw,nosuid,nodev shared:2 - {} {} rw\n'.format(mount_point, fstype, fstype)
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='mount table is only probed on Linux')
+@pytest.mark.parametrize('lines, accessible, expected', [
+    ([mountinfo_line('/dev/shm', 'tmpfs')], True, '/dev/shm'),
+    ([mountinfo_line('/tmp', 'ext4')], True, None),
+    ([mountinfo_line('/tmp', 'ext4'), mountinfo_line('/run/shm', 'ramfs')], True, '/run/shm'),
+    ([mountinfo_line('/dev/shm', 'tmpfs'), mountinfo_line('/run/user/{uid}', 'tmpfs')], True, '/run/user/{uid}'),
+    ([mountinfo_line('/dev/shm', 'tmpfs')], False, None),
+    ([mountinfo_line('/dev/shm', 'tmpfs'), 'malformed\n'], True, None)
+])
+def test_probe_memory_tempdir_parses_mountinfo(tmp_path, monkeypatch, lines, accessible, expected):
+    """
+    Assert that :func:`~scratchdir._probe_memory_tempdir` returns the first accessible, well-known directory
+    that the mount table lists as a memory backed filesystem.
+    """
+    uid = os.getuid()
+    mountinfo = tmp_path / 'mountinfo'
+    mountinfo.write_text(''.join(line.format(uid=uid) for line in lines))
+    monkeypatch.setattr(scratchdir, 'MOUNTINFO_PATH', str(mountinfo))
+    monkeypatch.setattr(os, 'access', lambda path, mode: accessible)
+    result = scratchdir._probe_memory_tempdir.__wrapped__()
+    assert result == (expected.format(uid=uid) if expected else None)
+
+
+def test_memory_tempdir_falls_back_when_not_linux(monkeypatch, mocker):
+    """
+    Assert that :func:`~scratchdir._memory_tempdir` returns the default temporary directory without
+    probing on platforms other than Linux.
+    """
+    monkeypatch.setattr(scratchdir, 'IS_LINUX', False)
+    patched = mocker.patch('scratchdir._probe_memory_tempdir')
+    assert scratchdir._memory_tempdir() == tempfile.gettempdir()
+    assert not patched.called
+
+
+def test_memory_tempdir_falls_back_when_probe_fails(monkeypatch):
+    """
+    Assert that :func:`~scratchdir._memory_tempdir` returns the default temporary directory when no
+    memory backed directory is found.
+    """
+    monkeypatch.setattr(scratchdir, 'IS_LINUX', True)
+    monkeypatch.setattr(scratchdir, '_probe_memory_tempdir', lambda: None)
+    assert scratchdir._memory_tempdir() == tempfile.gettempdir()
+
+
+def test_memory_tempdir_caches_probe(mocker):
+    """
+    Assert that :func:`~scratchdir._memory_tempdir` only reads the mount table once.
+    """
+    if not scratchdir.IS_LINUX:
+        pytest.skip('mount table is only probed on Linux')
+    scratchdir._probe_memory_tempdir.cache_clear()
+    scratchdir._memory_tempdir()
+    patched = mocker.patch('builtins.open')
+    scratchdir._memory_tempdir()
+    assert not patched.called
+
+
+def test_scratch_filename_is_unique_within_wd(active_scratch_dir):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.filename` returns unique, non-existent paths within the
+    working directory that use the given prefix and suffix.
+    """
+    names = {active_scratch_dir.filename(suffix='.txt', prefix='log-') for _ in range(100)}
+    assert len(names) == 100
+    for name in names:
+        assert os.path.dirname(name) == active_scratch_dir.wd
+        assert os.path.basename(name).startswith('log-')
+        assert name.endswith('.txt')
+        assert not os.path.exists(name)
+
+
+def test_scratch_join_returns_wd_without_paths(active_scratch_dir):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.join` returns the working directory when given no paths.
+    """
+    assert active_scratch_dir.join() == active_scratch_dir.wd
+    assert active_scratch_dir.join(None) == active_scratch_dir.wd
+
+
+def test_scratch_join_skips_none_and_coerces_paths(active_scratch_dir):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.join` skips `None` values and converts non-string
+    paths to strings.
+    """
+    expected = os.path.join(active_scratch_dir.wd, 'foo', 'bar')
+    assert active_scratch_dir.join('foo', None, pathlib.Path('bar')) == expected
+
+
+def test_scratch_bulk_create_creates_files(active_scratch_dir):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.bulk_create` creates the requested number of unique, empty
+    files within the working directory.
+    """
+    filenames = active_scratch_dir.bulk_create(10, suffix='.dat', prefix='bulk-')
+    assert len(set(filenames)) == 10
+    for filename in filenames:
+        assert os.path.dirname(filename) == active_scratch_dir.wd
+        assert os.path.basename(filename).startswith('bulk-')
+        assert filename.endswith('.dat')
+        assert os.path.getsize(filename) == 0
+
+
+def test_scratch_nested_creates_hierarchy(active_scratch_dir):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.nested` returns :class:`~scratchdir.ScratchDir` instances
+    whose working directories exist and are nested within one another.
+    """
+    grandparent, parent, child = active_scratch_dir.nested('grandparent-', 'parent-', 'child-')
+    assert is_pardir(active_scratch_dir.wd, grandparent.wd)
+    assert is_pardir(grandparent.wd, parent.wd)
+    assert is_pardir(parent.wd, child.wd)
+    assert os.path.basename(child.wd).startswith('child-')
+    assert os.path.isdir(child.wd)
+
+
+def test_scratch_nested_creates_private_dirs(active_scratch_dir):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.nested` creates every level of the hierarchy so it is
+    only accessible by the current user under a permissive umask.
+    """
+    umask = os.umask(0o022)
+    try:
+        children = active_scratch_dir.nested('grandparent-', 'parent-', 'child-')
+    finally:
+        os.umask(umask)
+    for child in children:
+        assert os.stat(child.wd).st_mode & 0o777 == 0o700
+
+
+def test_scratch_nested_children_are_usable_once_active(active_scratch_dir):
+    """
+    Assert that :class:`~scratchdir.ScratchDir` instances returned by :meth:`~scratchdir.ScratchDir.nested`
+    keep their working directory once activated and remove it on teardown.
+    """
+    parent, child = active_scratch_dir.nested('parent-', 'child-')
+    wd = child.wd
+    assert not child.is_active
+    with child:
+        assert child.wd == wd
+        assert os.path.exists(child.named().name)
+    assert not os.path.exists(wd)
+    assert os.path.exists(parent.wd)
+
+
+@pytest.mark.parametrize('wd, paths', [
+    ('/tmp/wd', ()),
+    ('/tmp/wd', ('foo',)),
+    ('/tmp/wd/', ('foo', 'bar')),
+    ('/tmp/wd', ('foo', None, 'bar/')),
+    ('/tmp/wd', ('foo', '/abs', 'bar')),
+    ('/tmp/wd', (pathlib.Path('foo'), 1)),
+    ('', ('foo',)),
+    (StrSubclass('/tmp/wd'), (StrSubclass('foo'),)),
+    (pathlib.Path('/tmp/wd'), ('foo',)),
+    (pathlib.Path('/tmp/wd'), ())
+])
+def test_join_fast_matches_python_implementation(wd, paths):
+    """
+    Assert that the compiled :func:`~_scratchdir_fast.join_fast` returns the same result as the
+    pure Python implementation.
+    """
+    fast = pytest.importorskip('_scratchdir_fast')
+    assert fast.join_fast(wd, paths) == scratchdir._py_join(wd, paths)
+
+
+def test_filename_fast_matches_python_implementation():
+    """
+    Assert that the compiled :func:`~_scratchdir_fast.filename_fast` returns filenames in the same format
+    as the pure Python implementation.
+    """
+    fast = pytest.importorskip('_scratchdir_fast')
+    fast_name = fast.filename_fast('/tmp/wd', 'log-', '.txt')
+    py_name = scratchdir._py_filename('/tmp/wd', 'log-', '.txt')
+    assert len(fast_name) == len(py_name)
+    assert fast_name.startswith('/tmp/wd/log-')
+    assert fast_name.endswith('.txt')
+    assert set(fast_name[len('/tmp/wd/log-'):-len('.txt')]) <= set('abcdefghijklmnopqrstuvwxyz234567')
+    assert fast_name != fast.filename_fast('/tmp/wd', 'log-', '.txt')
+    assert fast.filename_fast(pathlib.Path('/tmp/wd'), StrSubclass('log-'), '.txt').startswith('/tmp/wd/log-')
+
+
+def test_scratch_setup_does_not_modify_tempfile_tempdir(scratch_dir):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.setup` does not modify the process-wide
+    :data:`~tempfile.tempdir` value.
+    """
+    tempdir = tempfile.tempdir
+    with scratch_dir:
+        assert tempfile.tempdir == tempdir
+        assert is_pardir(scratch_dir.root, scratch_dir.wd)
+
+
+def test_fast_rmtree_removes_tree(active_scratch_dir):
+    """
+    Assert that :func:`~scratchdir._fast_rmtree` removes a directory containing nested files and directories
+    without following symlinks.
+    """
+    outside = active_scratch_dir.secure()
+    root = active_scratch_dir.directory()
+    subdir = os.path.join(root, 'a', 'b')
+    os.makedirs(subdir)
+    for path in (root, subdir):
+        with open(os.path.join(path, 'file'), 'w') as f:
+            f.write('scratch')
+    os.symlink(outside, os.path.join(subdir, 'link'))
+    os.symlink(active_scratch_dir.wd, os.path.join(root, 'dirlink'))
+
+    scratchdir._fast_rmtree(root)
+    assert not os.path.exists(root)
+    assert os.path.exists(outside)
+
+
+def test_fast_rmtree_ignores_entries_removed_while_walking(active_scratch_dir, mocker):
+    """
+    Assert that :func:`~scratchdir._fast_rmtree` keeps removing the remaining entries of a directory
+    when one of them disappears before it can be unlinked.
+    """
+    root = active_scratch_dir.directory()
+    for name in ('a', 'b', 'c'):
+        with open(os.path.join(root, name), 'w') as f:
+            f.write('scratch')
+
+    unlink = os.unlink
+    removed = []
+
+    def unlink_removed_by_another_process(path):
+        if not removed:
+            removed.append(path)
+            unlink(path)
+            raise FileNotFoundError(path)
+        unlink(path)
+
+    mocker.patch('os.unlink', side_effect=unlink_removed_by_another_process)
+    scratchdir._fast_rmtree(root)
+    assert removed
+    assert not os.path.exists(root)
+
+
+def test_scratch_has_no_instance_dict(scratch_dir):
+    """
+    Assert that :class:`~scratchdir.ScratchDir` instances use slots and do not allow arbitrary attributes.
+    """
+    with pytest.raises(AttributeError):
+        scratch_dir.foo = 'bar'
+
+
+def test_scratch_supports_weak_references(scratch_dir):
+    """
+    Assert that :class:`~scratchdir.ScratchDir` instances can be weakly referenced.
+    """
+    assert weakref.ref(scratch_dir)() is scratch_dir
+
+
+@pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+def test_scratch_is_picklable(active_scratch_dir, protocol):
+    """
+    Assert that :class:`~scratchdir.ScratchDir` instances can be pickled and unpickled with all protocols.
+    """
+    result = pickle.loads(pickle.dumps(active_scratch_dir, protocol))
+    assert result.wd == active_scratch_dir.wd
+    assert result.root == active_scratch_dir.root
+    assert result.is_active
+
+    with ScratchDirSubclass(prefix='sub-', root=active_scratch_dir.wd) as sd:
+        sd.extra = 'extra'
+        result = pickle.loads(pickle.dumps(sd, protocol))
+        assert result.extra == 'extra'
+        assert result.prefix == 'sub-'
+        assert result.root == sd.root
+        assert result.wd == sd.wd
+        assert result.is_active
+
+    with ScratchDirDictSubclass(prefix='sub-', root=active_scratch_dir.wd) as sd:
+        sd.extra = 'extra'
+        for result in (pickle.loads(pickle.dumps(sd, protocol)), copy.copy(sd)):
+            assert result.extra == 'extra'
+            assert result.prefix == 'sub-'
+            assert result.wd == sd.wd
+            assert result.is_active
+
+
+@pytest.mark.parametrize('mode', ['w+b', 'w+', 'wb'])
+def test_scratch_named_without_delete_keeps_name_and_file(active_scratch_dir, mode):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.named` returns a file-like object whose `name` is the path
+    of the file when `delete` is `False` and that the file remains on disk after it is closed.
+    """
+    f = active_scratch_dir.named(mode=mode, delete=False)
+    assert is_file_like_obj(f)
+    assert is_pardir(active_scratch_dir.wd, f.name)
+    f.write(b'scratch' if 'b' in mode else 'scratch')
+    f.close()
+    with open(f.name, 'rb') as check:
+        assert check.read() == b'scratch'
+
+
+def test_scratch_named_without_delete_removes_file_on_error(active_scratch_dir):
+    """
+    Assert that :meth:`~scratchdir.ScratchDir.named` raises the original error and removes the file
+    when it cannot be opened and `delete` is `False`.
+    """
+    with pytest.raises(LookupError):
+        active_scratch_dir.named(mode='w+', encoding='bogus-encoding', delete=False)
+    assert not os.listdir(active_scratch_dir.wd)
+
+
+def create_named(sd, dir, delete=True):
+    """
+    Helper function to create a named temporary file within the scratch dir and return its name.
+    """
+    with sd.named(dir=dir, delete=delete) as f:
+        return f.name
+
+
+@pytest.mark.parametrize('create', [
+    create_named,
+    lambda sd, dir: create_named(sd, dir, delete=False),
+    lambda sd, dir: sd.secure(dir=dir)
+])
+def test_scratch_file_methods_respect_dir(active_scratch_dir, create):
+    """
+    Assert that methods on :class:`~scratchdir.ScratchDir` that create files do so directly within the working
+    directory by default and within the given subdirectory when `dir` is set.
+    """
+    subdir = os.path.basename(active_scratch_dir.directory())
+    assert os.path.dirname(create(active_scratch_dir, None)) == active_scratch_dir.wd
+    assert os.path.dirname(create(active_scratch_dir, subdir)) == active_scratch_dir.join(subdir)